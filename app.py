@@ -1,63 +1,16 @@
 import streamlit as st
 import pywhatkit
-import sqlite3
 import os
-import csv
-import io
+from contextlib import nullcontext
 from datetime import datetime
 from PIL import Image
 import uuid
-
-# --- DATABASE SETUP ---
-DB_PATH = "vinci_products.db"
-UPLOAD_DIR = "uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-def init_db():
-    conn = get_db()
-    c = conn.cursor()
-    
-    c.execute('''CREATE TABLE IF NOT EXISTS products (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        price REAL NOT NULL,
-        currency TEXT DEFAULT 'R ZAR',
-        condition TEXT DEFAULT 'Good',
-        category TEXT DEFAULT 'Other',
-        description TEXT,
-        location TEXT,
-        whatsapp TEXT,
-        images TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        sold INTEGER DEFAULT 0,
-        share_count INTEGER DEFAULT 0,
-        last_shared TIMESTAMP
-    )''')
-    
-    c.execute('''CREATE TABLE IF NOT EXISTS price_history (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        product_id INTEGER,
-        old_price REAL,
-        new_price REAL,
-        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (product_id) REFERENCES products(id)
-    )''')
-    
-    c.execute('''CREATE TABLE IF NOT EXISTS templates (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        platform TEXT DEFAULT 'Both',
-        template TEXT NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )''')
-    
-    conn.commit()
-    conn.close()
+from vinci_db import (
+    UPLOAD_DIR, init_db, add_product, get_products, get_product, update_product,
+    delete_product, duplicate_product, get_price_history, track_share,
+    get_templates, add_template, delete_template, get_stats, products_to_csv
+)
+from vinci_backup import list_snapshots, snapshot_reads, start_background_snapshot
 
 init_db()
 
@@ -115,141 +68,10 @@ def needs_repost(last_shared):
     except:
         return True
 
-# --- DATABASE OPERATIONS ---
-def add_product(name, price, currency, condition, category, description, location, whatsapp, images):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute('''INSERT INTO products (name, price, currency, condition, category, description, location, whatsapp, images)
-                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-              (name, price, currency, condition, category, description, location, whatsapp, images))
-    conn.commit()
-    conn.close()
-
-def get_products(category_filter=None, status_filter=None, search_query=None):
-    conn = get_db()
-    c = conn.cursor()
-    query = "SELECT * FROM products WHERE 1=1"
-    params = []
-    if category_filter and category_filter != "All":
-        query += " AND category = ?"
-        params.append(category_filter)
-    if status_filter == "Available":
-        query += " AND sold = 0"
-    elif status_filter == "Sold":
-        query += " AND sold = 1"
-    if search_query:
-        query += " AND (name LIKE ? OR description LIKE ?)"
-        params.extend([f"%{search_query}%", f"%{search_query}%"])
-    query += " ORDER BY created_at DESC"
-    c.execute(query, params)
-    rows = c.fetchall()
-    conn.close()
-    return rows
-
-def get_product(product_id):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT * FROM products WHERE id = ?", (product_id,))
-    row = c.fetchone()
-    conn.close()
-    return row
-
-def update_product(product_id, **kwargs):
-    conn = get_db()
-    c = conn.cursor()
-    if 'price' in kwargs:
-        old = get_product(product_id)
-        if old and old['price'] != kwargs['price']:
-            c.execute("INSERT INTO price_history (product_id, old_price, new_price) VALUES (?, ?, ?)",
-                     (product_id, old['price'], kwargs['price']))
-    set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-    values = list(kwargs.values()) + [product_id]
-    c.execute(f"UPDATE products SET {set_clause} WHERE id = ?", values)
-    conn.commit()
-    conn.close()
-
-def delete_product(product_id):
-    conn = get_db()
-    c = conn.cursor()
-    product = get_product(product_id)
-    if product and product['images']:
-        for img in product['images'].split(','):
-            filepath = os.path.join(UPLOAD_DIR, img.strip())
-            if os.path.exists(filepath):
-                os.remove(filepath)
-    c.execute("DELETE FROM products WHERE id = ?", (product_id,))
-    c.execute("DELETE FROM price_history WHERE product_id = ?", (product_id,))
-    conn.commit()
-    conn.close()
-
-def duplicate_product(product_id):
-    product = get_product(product_id)
-    if product:
-        add_product(f"{product['name']} (Copy)", product['price'], product['currency'],
-                   product['condition'], product['category'], product['description'],
-                   product['location'], product['whatsapp'], product['images'])
-
-def get_price_history(product_id):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT * FROM price_history WHERE product_id = ? ORDER BY changed_at DESC", (product_id,))
-    rows = c.fetchall()
-    conn.close()
-    return rows
-
-def track_share(product_id):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("UPDATE products SET share_count = share_count + 1, last_shared = ? WHERE id = ?",
-             (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), product_id))
-    conn.commit()
-    conn.close()
-
-# --- TEMPLATES ---
-def get_templates():
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT * FROM templates ORDER BY created_at DESC")
-    rows = c.fetchall()
-    conn.close()
-    return rows
-
-def add_template(name, platform, template):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("INSERT INTO templates (name, platform, template) VALUES (?, ?, ?)", (name, platform, template))
-    conn.commit()
-    conn.close()
-
-def delete_template(template_id):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("DELETE FROM templates WHERE id = ?", (template_id,))
-    conn.commit()
-    conn.close()
-
 def apply_template(template_text, product):
     symbol = get_currency_symbol(product['currency'])
     return template_text.replace("{name}", product['name']).replace("{price}", f"{symbol}{product['price']}").replace("{condition}", product['condition']).replace("{description}", product['description'] or "").replace("{location}", product['location'] or "").replace("{category}", product['category'])
 
-# --- STATS ---
-def get_stats():
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT COUNT(*) FROM products")
-    total = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM products WHERE sold = 0")
-    available = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM products WHERE sold = 1")
-    sold = c.fetchone()[0]
-    c.execute("SELECT SUM(price) FROM products WHERE sold = 0")
-    inventory_value = c.fetchone()[0] or 0
-    c.execute("SELECT SUM(price) FROM products WHERE sold = 1")
-    revenue = c.fetchone()[0] or 0
-    c.execute("SELECT SUM(share_count) FROM products")
-    total_shares = c.fetchone()[0] or 0
-    conn.close()
-    return {"total": total, "available": available, "sold": sold, "inventory_value": inventory_value, "revenue": revenue, "total_shares": total_shares}
 
 # --- GENERATE LISTINGS ---
 def generate_whatsapp_message(product, template=None):
@@ -513,16 +335,18 @@ elif menu == "📱 WhatsApp Automation":
 # --- EXPORT DATA ---
 elif menu == "📤 Export Data":
     st.title("📤 Export Data")
-    products = get_products()
+    use_snapshot = st.checkbox("📸 Export from latest backup snapshot", help="Reads from the newest backup instead of the live database, so a large export never blocks sellers adding products.")
+    with snapshot_reads() if use_snapshot else nullcontext() as snapshot:
+        if use_snapshot:
+            if snapshot:
+                st.caption(f"Reading from snapshot: {snapshot}")
+            else:
+                st.warning("No backup snapshot yet - exporting live data.")
+        products = get_products()
+        stats = get_stats()
     if products:
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(['Name', 'Price', 'Currency', 'Condition', 'Category', 'Description', 'Location', 'WhatsApp', 'Sold', 'Shares', 'Created'])
-        for p in products:
-            writer.writerow([p['name'], p['price'], p['currency'], p['condition'], p['category'], p['description'], p['location'], p['whatsapp'], 'Yes' if p['sold'] else 'No', p['share_count'], p['created_at']])
-        st.download_button("📥 Download CSV", output.getvalue(), f"vinci_products_{datetime.now().strftime('%Y%m%d')}.csv", "text/csv", type="primary")
+        st.download_button("📥 Download CSV", products_to_csv(products), f"vinci_products_{datetime.now().strftime('%Y%m%d')}.csv", "text/csv", type="primary")
         st.divider()
-        stats = get_stats()
         st.subheader("📈 Summary")
         st.markdown(f"""
 **Total Products:** {stats['total']} | **Available:** {stats['available']} | **Sold:** {stats['sold']}
@@ -531,6 +355,20 @@ elif menu == "📤 Export Data":
         """)
     else:
         st.info("No products to export")
+    st.divider()
+    st.subheader("💾 Backups")
+    st.caption("Snapshots copy the database in small steps in the background, together with your uploaded images.")
+    if st.button("💾 Back Up Now"):
+        if start_background_snapshot():
+            st.success("Backup started in the background.")
+        else:
+            st.info("A backup is already running.")
+    snapshots = list_snapshots()
+    if snapshots:
+        for path in reversed(snapshots):
+            st.caption(f"📁 {path}")
+    else:
+        st.info("No backups yet.")
 
 # --- FOOTER ---
 st.sidebar.divider()
@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinci_api
+import vinci_db
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setattr(vinci_db, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(vinci_db, "DB_PATH", vinci_db.DB_PATH)  # make_server overrides it
+    server = vinci_api.make_server("127.0.0.1", 0, str(tmp_path / "test.db"))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    vinci_db.add_product("Chair", 100.0, "R ZAR", "Good", "Furniture 🛋️", "Comfy", "Cape Town", "+27", "")
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url, **headers):
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as r:
+            return r.status, dict(r.headers), r.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def test_etag_roundtrip(api):
+    status, headers, body = get(api + "/api/products")
+    assert status == 200
+    assert json.loads(body)["total"] == 1
+    assert get(api + "/api/products", **{"If-None-Match": headers["ETag"]})[0] == 304
+
+    vinci_db.add_product("Table", 200.0, "R ZAR", "New", "Furniture 🛋️", "Oak", "Durban", "+27", "")
+    status, _, body = get(api + "/api/products", **{"If-None-Match": headers["ETag"]})
+    assert status == 200
+    assert json.loads(body)["total"] == 2
+
+
+def test_unknown_product_is_404_even_with_if_none_match(api):
+    status, _, body = get(api + "/api/products/999999", **{"If-None-Match": "*"})
+    assert status == 404
+    assert "not found" in json.loads(body)["error"]
+
+
+def test_huge_product_id_is_404(api):
+    status, _, body = get(api + "/api/products/99999999999999999999")
+    assert status == 404
+    assert json.loads(body) == {"error": "Not found"}
+    assert get(api + f"/api/products/{2**63 - 1}")[0] == 404
+
+
+def test_huge_page_is_400(api):
+    status, _, body = get(api + "/api/products?page=99999999999999999999")
+    assert status == 400
+    assert "page" in json.loads(body)["error"]
+
+
+def test_unexpected_error_is_json_500(api, monkeypatch):
+    def boom():
+        raise RuntimeError("boom")
+    monkeypatch.setattr(vinci_api, "get_stats", boom)
+    status, _, body = get(api + "/api/stats")
+    assert status == 500
+    assert json.loads(body) == {"error": "Internal server error"}
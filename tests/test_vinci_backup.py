@@ -0,0 +1,126 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinci_backup
+import vinci_db
+
+
+@pytest.fixture
+def live(tmp_path, monkeypatch):
+    uploads = tmp_path / "uploads"  # absolute, to catch os.path.join dropping the snapshot dir
+    uploads.mkdir()
+    (uploads / "a.jpg").write_bytes(b"img")
+    monkeypatch.setattr(vinci_db, "DB_PATH", str(tmp_path / "live.db"))
+    monkeypatch.setattr(vinci_db, "UPLOAD_DIR", str(uploads))
+    vinci_db.init_db()
+    vinci_db.add_product("Chair", 100.0, "R ZAR", "Good", "Furniture 🛋️", "Comfy", "Cape Town", "+27", "a.jpg")
+    return tmp_path
+
+
+def test_snapshot_rotation_and_reads(live):
+    backup_dir = str(live / "backups")
+    for _ in range(3):
+        assert vinci_backup.create_snapshot(keep=2, sleep=0, backup_dir=backup_dir)
+    snapshots = vinci_backup.list_snapshots(backup_dir)
+    assert len(snapshots) == 2
+    assert os.listdir(os.path.join(snapshots[-1], vinci_backup.UPLOADS_SUBDIR)) == ["a.jpg"]
+
+    vinci_db.add_product("Table", 200.0, "R ZAR", "New", "Furniture 🛋️", "Oak", "Durban", "+27", "")
+    with vinci_backup.snapshot_reads(backup_dir) as path:
+        assert path == vinci_backup.latest_snapshot(backup_dir)
+        assert vinci_db.get_stats()["total"] == 1
+    assert vinci_db.get_stats()["total"] == 2
+
+
+@pytest.mark.parametrize("keep", [0, -1])
+def test_rotation_always_keeps_latest_snapshot(live, keep):
+    backup_dir = str(live / "backups")
+    for _ in range(2):
+        vinci_backup.create_snapshot(keep=5, sleep=0, backup_dir=backup_dir)
+    newest = vinci_backup.list_snapshots(backup_dir)[-1]
+    vinci_backup.rotate_snapshots(keep=keep, backup_dir=backup_dir)
+    assert vinci_backup.list_snapshots(backup_dir) == [newest]
+
+
+@pytest.mark.parametrize("keep", ["0", "-1"])
+def test_cli_rejects_keep_below_one(live, keep):
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "vinci_backup.py")
+    result = subprocess.run(
+        [sys.executable, script, "--db", vinci_db.DB_PATH, "--backup-dir", str(live / "backups"), "backup", "--keep", keep],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 2
+    assert "--keep must be at least 1" in result.stderr
+    assert not os.path.exists(live / "backups")
+
+
+def test_copy_database_gives_up_after_max_restarts(live, monkeypatch):
+    conn = vinci_db.get_db()
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.executemany("INSERT INTO templates (name, template) VALUES (?, ?)", [("t", "x" * 1000)] * 50)
+    conn.commit()
+    conn.close()
+
+    step_sleep = 0.001
+    backoffs = []
+
+    def fake_sleep(seconds):
+        if seconds == step_sleep:
+            # A write from another connection between steps restarts the backup
+            vinci_db.add_template("w", "Both", "w")
+        else:
+            backoffs.append(seconds)
+
+    monkeypatch.setattr(vinci_backup.time, "sleep", fake_sleep)
+    with pytest.raises(vinci_backup.BackupBusyError, match="after 3 restarts"):
+        vinci_backup.copy_database(str(live / "copy.db"), pages=1, sleep=step_sleep, max_restarts=3)
+    assert backoffs == [0.002, 0.004]  # no backoff after the final attempt
+
+
+def test_background_snapshot_reports_busy_immediately(live):
+    backup_dir = str(live / "backups")
+    release = threading.Event()
+    original = vinci_backup._write_snapshot
+
+    def slow_write(*args):
+        release.wait(5)
+        return original(*args)
+
+    vinci_backup._write_snapshot = slow_write
+    try:
+        assert vinci_backup.start_background_snapshot(sleep=0, backup_dir=backup_dir) is True
+        assert vinci_backup.start_background_snapshot(sleep=0, backup_dir=backup_dir) is False
+        assert vinci_backup.create_snapshot(sleep=0, backup_dir=backup_dir) is None
+    finally:
+        release.set()
+        vinci_backup._write_snapshot = original
+    with vinci_backup._backup_lock:  # released by the worker once it finishes
+        pass
+    assert len(vinci_backup.list_snapshots(backup_dir)) == 1
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_snapshot_names_are_utc(live):
+    original_tz = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    try:
+        path = vinci_backup.create_snapshot(sleep=0, backup_dir=str(live / "backups"))
+    finally:
+        if original_tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = original_tz
+        time.tzset()
+    name = os.path.basename(path)
+    assert name.endswith("Z")
+    stamp = datetime.strptime(name, "%Y%m%d-%H%M%S-%fZ").replace(tzinfo=timezone.utc)
+    assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 60
@@ -0,0 +1,55 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinci_bot
+
+
+def test_run_batch_keeps_order_and_isolates_errors():
+    items = [{"item_name": f"Item {i}", "price": i + 1, "offer_price": i} for i in range(50)]
+    items.insert(10, {"item_name": "No price"})
+    out = io.StringIO()
+    total, errors = vinci_bot.run_batch(iter(items), out, workers=1, chunk_size=7)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert (total, errors) == (51, 1)
+    assert [r["index"] for r in records] == list(range(51))
+    assert records[10]["error"] == "item_name and price are required"
+    assert records[0]["listing"] == vinci_bot.render_fb_listing("Item 0", 1, "Good", "- ")
+    assert "counter_offer" in records[11]
+
+
+@pytest.mark.parametrize("args", [["-w", "-1"], ["-w", "0"], ["--chunk-size", "0"]])
+def test_batch_rejects_non_positive_options(args):
+    with pytest.raises(SystemExit) as exc:
+        vinci_bot.batch_main(args)
+    assert exc.value.code == 2
+
+
+def test_batch_rejects_missing_input_before_touching_output(tmp_path, capsys):
+    output = tmp_path / "out.jsonl"
+    output.write_text("keep me")
+    with pytest.raises(SystemExit) as exc:
+        vinci_bot.batch_main([str(tmp_path / "missing.csv"), "-o", str(output)])
+    assert exc.value.code == 2
+    assert "missing.csv" in capsys.readouterr().err
+    assert output.read_text() == "keep me"
+
+
+def test_batch_rejects_stdin_twice():
+    with pytest.raises(SystemExit) as exc:
+        vinci_bot.batch_main(["-", "-"])
+    assert exc.value.code == 2
+
+
+def test_batch_reads_stdin_without_closing_it(tmp_path, monkeypatch):
+    stdin = io.TextIOWrapper(io.BytesIO(b'{"item_name": "Lamp", "price": 50}\n'), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    output = tmp_path / "out.jsonl"
+    assert vinci_bot.batch_main(["-", "-w", "1", "-o", str(output)]) == 0
+    assert not stdin.closed
+    assert json.loads(output.read_text())["item_name"] == "Lamp"
@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinci_db
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(vinci_db, "DB_PATH", str(tmp_path / "test.db"))
+    monkeypatch.setattr(vinci_db, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    vinci_db.init_db()
+    return vinci_db
+
+
+def test_product_lifecycle(db):
+    db.add_product("Chair", 100.0, "R ZAR", "Good", "Furniture 🛋️", "Comfy", "Cape Town", "+27", "")
+    db.add_product("Table", 200.0, "R ZAR", "New", "Furniture 🛋️", "Oak", "Durban", "+27", "")
+    assert db.count_products() == 2
+    assert [p["name"] for p in db.get_products(limit=1, offset=1)] == ["Chair"]
+    assert [p["name"] for p in db.get_products(search_query="Oak")] == ["Table"]
+
+    chair = db.get_products(search_query="Chair")[0]
+    db.update_product(chair["id"], price=150.0)
+    assert db.get_product(chair["id"])["price"] == 150.0
+    assert len(db.get_price_history(chair["id"])) == 1
+
+    db.track_share(chair["id"])
+    shared = db.get_product(chair["id"])
+    assert shared["share_count"] == 1
+    assert shared["last_shared"] is not None
+
+    db.duplicate_product(chair["id"])
+    assert db.count_products() == 3
+
+    db.update_product(chair["id"], sold=1)
+    stats = db.get_stats()
+    assert stats["total"] == 3
+    assert stats["sold"] == 1
+    assert stats["revenue"] == 150.0
+    assert stats["total_shares"] == 1
+
+    csv_text = db.products_to_csv(db.get_products())
+    assert csv_text.splitlines()[0].startswith("Name,Price")
+    assert len(csv_text.splitlines()) == 4
+
+    db.delete_product(chair["id"])
+    assert db.get_product(chair["id"]) is None
+    assert db.get_price_history(chair["id"]) == []
+
+
+def test_templates(db):
+    db.add_template("Promo", "Both", "🔥 {name} - {price}")
+    templates = db.get_templates()
+    assert db.count_templates() == 1
+    assert templates[0]["name"] == "Promo"
+    db.delete_template(templates[0]["id"])
+    assert db.get_templates() == []
@@ -0,0 +1,284 @@
+import argparse
+import gzip
+import json
+import logging
+import math
+import sqlite3
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import vinci_db
+from vinci_db import (
+    init_db, get_products, count_products, get_product, get_stats,
+    get_templates, count_templates
+)
+
+# Setup Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler()]
+)
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+MAX_PAGE = 1_000_000
+MAX_SQLITE_INT = 2**63 - 1
+GZIP_MIN_BYTES = 512
+CACHE_MAX_ENTRIES = 256
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# --- DATA VERSION ---
+class DataVersion:
+    """
+    Counts catalog changes using SQLite's PRAGMA data_version.
+    The pragma only moves when another connection commits, so a single
+    long-lived connection sees every write made by the Streamlit app.
+    """
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.epoch = uuid.uuid4().hex[:8]  # New ETags after every restart
+        self.counter = 0
+        self.last_seen = None
+
+    def current(self):
+        with self.lock:
+            seen = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if seen != self.last_seen:
+                self.last_seen = seen
+                self.counter += 1
+            return f"{self.epoch}-{self.counter}"
+
+
+# --- RESPONSE CACHE ---
+class ResponseCache:
+    """
+    Keeps rendered (and gzipped) bodies for the current data version only,
+    so repeated polls of the same URL skip the database entirely.
+    """
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.version = None
+        self.entries = {}
+
+    def get(self, version, key):
+        with self.lock:
+            if version != self.version:
+                return None
+            return self.entries.get(key)
+
+    def put(self, version, key, entry):
+        with self.lock:
+            if version != self.version:
+                self.version = version
+                self.entries = {}
+            if len(self.entries) >= self.max_entries:
+                self.entries.pop(next(iter(self.entries)))
+            self.entries[key] = entry
+
+
+# --- HELPERS ---
+def row_to_dict(row):
+    return {key: row[key] for key in row.keys()}
+
+def get_int_param(params, name, default, minimum=1, maximum=None):
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise ApiError(400, f"'{name}' must be an integer")
+    if value < minimum:
+        raise ApiError(400, f"'{name}' must be at least {minimum}")
+    if maximum is not None and value > maximum:
+        raise ApiError(400, f"'{name}' must be at most {maximum}")
+    return value
+
+def get_str_param(params, name):
+    values = params.get(name)
+    return values[0] if values and values[0] else None
+
+def paginate(params, fetch, count):
+    page = get_int_param(params, "page", 1, maximum=MAX_PAGE)
+    per_page = min(get_int_param(params, "per_page", DEFAULT_PER_PAGE), MAX_PER_PAGE)
+    total = count()
+    rows = fetch(per_page, (page - 1) * per_page)
+    return {
+        "items": [row_to_dict(r) for r in rows],
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "pages": math.ceil(total / per_page) if total else 0,
+    }
+
+def accepts_gzip(header):
+    for part in (header or "").split(","):
+        coding, _, q = part.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            q = q.strip()
+            return q not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+def etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison: the W/ prefix is ignored on both sides
+    def opaque(tag):
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+    return opaque(etag) in [opaque(t) for t in header.split(",")]
+
+
+# --- ROUTES ---
+def list_products(params):
+    filters = {
+        "category_filter": get_str_param(params, "category"),
+        "status_filter": get_str_param(params, "status"),
+        "search_query": get_str_param(params, "q"),
+    }
+    return paginate(
+        params,
+        lambda limit, offset: get_products(limit=limit, offset=offset, **filters),
+        lambda: count_products(**filters),
+    )
+
+def show_product(product_id):
+    product = get_product(product_id)
+    if product is None:
+        raise ApiError(404, f"Product {product_id} not found")
+    return row_to_dict(product)
+
+def list_templates(params):
+    return paginate(
+        params,
+        lambda limit, offset: get_templates(limit=limit, offset=offset),
+        count_templates,
+    )
+
+def route(path, params):
+    parts = [p for p in path.split("/") if p]
+    if parts == ["api", "products"]:
+        return list_products(params)
+    if len(parts) == 3 and parts[:2] == ["api", "products"]:
+        if not parts[2].isdigit() or int(parts[2]) > MAX_SQLITE_INT:
+            raise ApiError(404, "Not found")
+        return show_product(int(parts[2]))
+    if parts == ["api", "stats"]:
+        return get_stats()
+    if parts == ["api", "templates"]:
+        return list_templates(params)
+    raise ApiError(404, "Not found")
+
+
+# --- SERVER ---
+class CatalogHandler(BaseHTTPRequestHandler):
+    server_version = "VinciVantageAPI/1.0"
+    data_version = None
+    cache = None
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def serve(self, send_body):
+        url = urlparse(self.path)
+        version = self.data_version.current()
+        etag = f'W/"{version}"'
+
+        # Resolve the route before looking at If-None-Match, so unknown URLs
+        # and bad parameters get their 4xx instead of a 304
+        key = url.path + "?" + url.query
+        entry = self.cache.get(version, key)
+        if entry is None:
+            try:
+                payload = route(url.path, parse_qs(url.query))
+            except ApiError as e:
+                self.send_json(e.status, {"error": e.message}, send_body)
+                return
+            except Exception:
+                logging.exception(f"Error handling {self.path}")
+                self.send_json(500, {"error": "Internal server error"}, send_body)
+                return
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+            compressed = gzip.compress(body) if len(body) >= GZIP_MIN_BYTES else None
+            entry = (body, compressed)
+            self.cache.put(version, key, entry)
+
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        body, compressed = entry
+        use_gzip = compressed is not None and accepts_gzip(self.headers.get("Accept-Encoding"))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            body = compressed
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def send_json(self, status, payload, send_body=True):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Polling clients hit us constantly; keep per-request lines out of INFO
+        logging.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(host, port, db_path):
+    vinci_db.DB_PATH = db_path
+    init_db()
+    handler = type("BoundCatalogHandler", (CatalogHandler,), {
+        "data_version": DataVersion(db_path),
+        "cache": ResponseCache(),
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the Vinci-Vantage catalog.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--db", default=vinci_db.DB_PATH, help="Path to the SQLite database")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.db)
+    logging.info(f"Vinci-Vantage API listening on http://{args.host}:{args.port}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Shutting down Vinci-Vantage API. Goodbye!")
+    finally:
+        server.server_close()
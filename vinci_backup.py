@@ -0,0 +1,266 @@
+import argparse
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import vinci_db
+from vinci_db import get_products, get_stats, products_to_csv, reading_from
+
+BACKUP_DIR = "backups"
+DB_FILENAME = "vinci_products.db"
+UPLOADS_SUBDIR = "uploads"
+KEEP_SNAPSHOTS = 7
+PAGES_PER_STEP = 64     # ~256KB per step with the default 4KB page size
+SLEEP_BETWEEN_STEPS = 0.05
+MAX_PAGES_PER_STEP = 4096  # ~16MB; caps how long one step holds the read lock
+MAX_RESTARTS = 8
+MAX_BACKOFF = 5.0
+
+_backup_lock = threading.Lock()
+
+
+# --- SNAPSHOTS ---
+def list_snapshots(backup_dir=BACKUP_DIR):
+    """
+    Returns completed snapshot directories, oldest first. In-progress
+    snapshots live in dot-prefixed temp directories and are never listed.
+    """
+    if not os.path.isdir(backup_dir):
+        return []
+    names = sorted(
+        n for n in os.listdir(backup_dir)
+        if not n.startswith(".") and os.path.isfile(os.path.join(backup_dir, n, DB_FILENAME))
+    )
+    return [os.path.join(backup_dir, n) for n in names]
+
+def latest_snapshot(backup_dir=BACKUP_DIR):
+    """
+    Path to the newest snapshot database, or None if there is none yet.
+    """
+    snapshots = list_snapshots(backup_dir)
+    return os.path.join(snapshots[-1], DB_FILENAME) if snapshots else None
+
+class BackupBusyError(Exception):
+    pass
+
+class _Restarted(Exception):
+    pass
+
+def copy_database(dest_path, pages=PAGES_PER_STEP, sleep=SLEEP_BETWEEN_STEPS, max_restarts=MAX_RESTARTS):
+    """
+    Copies the live database with the SQLite online backup API, a few pages
+    at a time. The read lock is dropped between steps and we sleep, so the
+    app can keep committing while a backup runs.
+
+    SQLite restarts a paged backup whenever another connection writes. In
+    WAL mode (set by init_db) we then finish in one step: a WAL reader works
+    from its own snapshot and never blocks writers. With a rollback journal
+    a single step would lock out writers for the whole copy, so instead we
+    back off and retry with bigger steps (capped at MAX_PAGES_PER_STEP), and
+    raise BackupBusyError if the database never stays quiet long enough.
+    """
+    src = sqlite3.connect(vinci_db.DB_PATH)
+    dst = sqlite3.connect(dest_path)
+    try:
+        wal = src.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+        # Each failed attempt is one restart; give up on the max_restarts-th
+        attempts = max(max_restarts, 1)
+        for attempt in range(attempts):
+            last_remaining = None
+
+            def pause(status, remaining, total):
+                nonlocal last_remaining
+                if last_remaining is not None and remaining > last_remaining:
+                    raise _Restarted()
+                last_remaining = remaining
+                if remaining:
+                    time.sleep(sleep)
+
+            try:
+                src.backup(dst, pages=pages, progress=pause, sleep=sleep)
+                return
+            except _Restarted:
+                pass
+            if wal:
+                logging.info("Backup restarted by a concurrent write, finishing from a WAL snapshot in one step.")
+                src.backup(dst, sleep=sleep)
+                return
+            if attempt == attempts - 1:
+                break
+            pages = min(pages * 2, MAX_PAGES_PER_STEP)
+            backoff = min(sleep * 2 ** (attempt + 1), MAX_BACKOFF)
+            logging.info(f"Backup restarted by a concurrent write, retrying with {pages} pages per step in {backoff:.2f}s.")
+            time.sleep(backoff)
+        raise BackupBusyError(f"Database kept changing; gave up after {attempts} restarts.")
+    finally:
+        dst.close()
+        src.close()
+
+def link_uploads(dest_dir):
+    """
+    Mirrors UPLOAD_DIR into `dest_dir`. Uploaded images are write-once
+    (uuid filenames), so hard links make every snapshot after the first
+    cost almost nothing; we fall back to copying across filesystems.
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    if not os.path.isdir(vinci_db.UPLOAD_DIR):
+        return 0
+    count = 0
+    for name in os.listdir(vinci_db.UPLOAD_DIR):
+        src = os.path.join(vinci_db.UPLOAD_DIR, name)
+        if not os.path.isfile(src):
+            continue
+        try:
+            os.link(src, os.path.join(dest_dir, name))
+        except OSError:
+            shutil.copy2(src, os.path.join(dest_dir, name))
+        count += 1
+    return count
+
+def rotate_snapshots(keep=KEEP_SNAPSHOTS, backup_dir=BACKUP_DIR):
+    """
+    Deletes all but the newest `keep` snapshots (always at least one).
+    """
+    keep = max(keep, 1)
+    removed = []
+    for path in list_snapshots(backup_dir)[:-keep]:
+        shutil.rmtree(path, ignore_errors=True)
+        removed.append(path)
+    return removed
+
+def create_snapshot(keep=KEEP_SNAPSHOTS, pages=PAGES_PER_STEP, sleep=SLEEP_BETWEEN_STEPS, backup_dir=BACKUP_DIR):
+    """
+    Takes a new snapshot (database + uploads) and rotates old ones.
+    Returns the snapshot directory, or None if another backup is running.
+    """
+    if not _backup_lock.acquire(blocking=False):
+        logging.warning("Backup already in progress, skipping.")
+        return None
+    try:
+        return _write_snapshot(keep, pages, sleep, backup_dir)
+    finally:
+        _backup_lock.release()
+
+def _write_snapshot(keep, pages, sleep, backup_dir):
+    # Caller must hold _backup_lock
+    os.makedirs(backup_dir, exist_ok=True)
+    # UTC so that sorting names gives creation order, even across DST changes
+    name = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-%fZ")
+    tmp_dir = os.path.join(backup_dir, f".tmp-{name}")
+    final_dir = os.path.join(backup_dir, name)
+
+    start = time.perf_counter()
+    try:
+        os.makedirs(tmp_dir)
+        copy_database(os.path.join(tmp_dir, DB_FILENAME), pages=pages, sleep=sleep)
+        images = link_uploads(os.path.join(tmp_dir, UPLOADS_SUBDIR))
+        os.rename(tmp_dir, final_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    logging.info(f"Snapshot {final_dir} written ({images} images) in {time.perf_counter() - start:.2f}s")
+
+    for path in rotate_snapshots(keep, backup_dir):
+        logging.info(f"Removed old snapshot {path}")
+    return final_dir
+
+def start_background_snapshot(keep=KEEP_SNAPSHOTS, pages=PAGES_PER_STEP, sleep=SLEEP_BETWEEN_STEPS, backup_dir=BACKUP_DIR):
+    """
+    Runs a snapshot on a daemon thread so callers (like the Streamlit app)
+    never wait on it. Returns False if a backup is already running.
+    """
+    # Take the lock here, not in the thread, so two quick callers can't both get True
+    if not _backup_lock.acquire(blocking=False):
+        return False
+
+    def run():
+        try:
+            _write_snapshot(keep, pages, sleep, backup_dir)
+        except Exception:
+            logging.exception("Background backup failed")
+        finally:
+            _backup_lock.release()
+
+    try:
+        threading.Thread(target=run, daemon=True).start()
+    except Exception:
+        _backup_lock.release()
+        raise
+    return True
+
+
+# --- SNAPSHOT READS ---
+@contextmanager
+def snapshot_reads(backup_dir=BACKUP_DIR):
+    """
+    Serves vinci_db reads in this block from the latest snapshot instead of
+    the live database, so long exports and analytics never hold read locks
+    against sellers adding products. Yields the snapshot path, or None when
+    no snapshot exists yet (reads then fall through to the live database).
+    """
+    path = latest_snapshot(backup_dir)
+    if path is None:
+        yield None
+        return
+    with reading_from(path):
+        yield path
+
+
+if __name__ == "__main__":
+    # Setup Logging (only when run as a script; the app imports this module)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+    parser = argparse.ArgumentParser(description="Online backups and snapshot reads for Vinci-Vantage.")
+    parser.add_argument("--db", default=vinci_db.DB_PATH, help="Path to the live SQLite database")
+    parser.add_argument("--backup-dir", default=BACKUP_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_backup = sub.add_parser("backup", help="Take a snapshot of the database and uploads")
+    p_backup.add_argument("--keep", type=int, default=KEEP_SNAPSHOTS, help="Snapshots to keep after rotation")
+    p_backup.add_argument("--pages", type=int, default=PAGES_PER_STEP, help="Pages copied per backup step")
+    p_backup.add_argument("--sleep", type=float, default=SLEEP_BETWEEN_STEPS, help="Seconds to sleep between steps")
+    sub.add_parser("list", help="List snapshots, oldest first")
+    p_export = sub.add_parser("export", help="Export products as CSV from the latest snapshot")
+    p_export.add_argument("-o", "--output", default="-", help="CSV file ('-' for stdout)")
+    sub.add_parser("stats", help="Print stats computed from the latest snapshot")
+    args = parser.parse_args()
+    if args.command == "backup" and args.keep < 1:
+        parser.error("--keep must be at least 1")
+
+    vinci_db.DB_PATH = args.db
+
+    if args.command == "backup":
+        if not os.path.exists(args.db):
+            sys.exit(f"Database not found: {args.db}")
+        try:
+            create_snapshot(keep=args.keep, pages=args.pages, sleep=args.sleep, backup_dir=args.backup_dir)
+        except BackupBusyError as e:
+            sys.exit(f"Backup failed: {e} Try again when the app is quieter.")
+    elif args.command == "list":
+        for path in list_snapshots(args.backup_dir):
+            print(path)
+    else:
+        with snapshot_reads(args.backup_dir) as snapshot:
+            if snapshot is None:
+                sys.exit("No snapshot yet. Run: python vinci_backup.py backup")
+            logging.info(f"Reading from snapshot {snapshot}")
+            if args.command == "export":
+                data = products_to_csv(get_products())
+                if args.output == "-":
+                    sys.stdout.write(data)
+                else:
+                    with open(args.output, "w", newline="", encoding="utf-8") as f:
+                        f.write(data)
+            else:
+                for key, value in get_stats().items():
+                    print(f"{key}: {value}")
@@ -1,7 +1,15 @@
 import time
 import logging
-import pywhatkit  # The engine for WhatsApp automation
 import datetime
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 
 # Setup Logging
 logging.basicConfig(
@@ -10,18 +18,11 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]
 )
 
-class VinciCommerceBot:
-    def __init__(self):
-        logging.info("Vinci-Vantage Commerce Protocol Initialized.")
-        self.my_phone = "+1234567890"  # Your phone number (optional config)
-
-    def generate_fb_listing(self, item_name, price, condition, features):
-        """
-        Generates a high-conversion description to copy/paste into Facebook Marketplace.
-        """
-        logging.info(f"Generating listing for: {item_name}")
-        
-        listing_text = f"""
+def render_fb_listing(item_name, price, condition, features):
+    """
+    Builds the Facebook Marketplace listing text without any logging or printing.
+    """
+    return f"""
 🔥 {item_name.upper()} - GREAT CONDITION - ${price}
 
 Selling a {condition} {item_name}. 
@@ -34,6 +35,34 @@ Selling a {condition} {item_name}.
 
 First come, first served. Message me on WhatsApp if interested!
         """
+
+def render_negotiation_response(original_price, offer_price):
+    """
+    Builds the counter-offer text (midpoint of listed price and offer).
+    """
+    counter = (float(original_price) + float(offer_price)) / 2
+    return f"""
+💬 Suggested Counter-Offer Response:
+
+"Thanks for your interest! I appreciate the offer of ${offer_price}, 
+but my lowest would be ${counter:.0f}. Let me know if that works for you!"
+        """
+
+def format_features(feats):
+    return "\n".join([f"- {f.strip()}" for f in feats.split(",")])
+
+class VinciCommerceBot:
+    def __init__(self):
+        logging.info("Vinci-Vantage Commerce Protocol Initialized.")
+        self.my_phone = "+1234567890"  # Your phone number (optional config)
+
+    def generate_fb_listing(self, item_name, price, condition, features):
+        """
+        Generates a high-conversion description to copy/paste into Facebook Marketplace.
+        """
+        logging.info(f"Generating listing for: {item_name}")
+        
+        listing_text = render_fb_listing(item_name, price, condition, features)
         print("\n" + "="*50)
         print(listing_text)
         print("="*50 + "\n")
@@ -51,6 +80,7 @@ First come, first served. Message me on WhatsApp if interested!
                    f"I am interested. Would you accept ${offer_price} if I pick it up today?")
         
         try:
+            import pywhatkit  # The engine for WhatsApp automation
             # Sending message instantly (wait_time is delay before typing)
             # tab_close=True tries to close the tab after sending
             pywhatkit.sendwhatmsg_instantly(
@@ -73,6 +103,7 @@ First come, first served. Message me on WhatsApp if interested!
                    f"Are you still interested? I can hold it for you if you confirm today.")
         
         try:
+            import pywhatkit
             pywhatkit.sendwhatmsg_instantly(
                 phone_no=buyer_phone, 
                 message=message, 
@@ -87,14 +118,7 @@ First come, first served. Message me on WhatsApp if interested!
         """
         Generate a counter-offer response for negotiations.
         """
-        counter = (float(original_price) + float(offer_price)) / 2
-        
-        response = f"""
-💬 Suggested Counter-Offer Response:
-
-"Thanks for your interest! I appreciate the offer of ${offer_price}, 
-but my lowest would be ${counter:.0f}. Let me know if that works for you!"
-        """
+        response = render_negotiation_response(original_price, offer_price)
         print(response)
         return response
 
@@ -122,7 +146,7 @@ but my lowest would be ${counter:.0f}. Let me know if that works for you!"
             price = input("Price ($): ")
             cond = input("Condition (New/Like New/Good/Fair): ")
             feats = input("Key Features (comma separated): ")
-            features_formatted = "\n".join([f"- {f.strip()}" for f in feats.split(",")])
+            features_formatted = format_features(feats)
             self.generate_fb_listing(item, price, cond, features_formatted)
             
         elif choice == '2':
@@ -162,7 +186,177 @@ but my lowest would be ${counter:.0f}. Let me know if that works for you!"
             print("Invalid option. Please try again.")
 
 
+# --- HEADLESS BATCH MODE ---
+def render_item(item):
+    """
+    Renders one input record into an output record. Never raises, so a bad
+    row in a supplier sheet does not take down the whole batch.
+    """
+    if "_parse_error" in item:
+        return {"item_name": None, "error": item["_parse_error"]}
+    try:
+        name = item.get("item_name") or item.get("name")
+        price = item.get("price")
+        if not name or price in (None, ""):
+            raise ValueError("item_name and price are required")
+        features = item.get("features") or ""
+        if isinstance(features, list):
+            features = ",".join(str(f) for f in features)
+        result = {
+            "item_name": name,
+            "listing": render_fb_listing(name, price, item.get("condition") or "Good", format_features(features)),
+        }
+        if item.get("offer_price") not in (None, ""):
+            result["counter_offer"] = render_negotiation_response(price, item["offer_price"])
+        return result
+    except Exception as e:
+        return {"item_name": item.get("item_name") or item.get("name"), "error": str(e)}
+
+def render_chunk(start, chunk):
+    """
+    Renders a chunk straight to JSONL text in the worker, so the parent
+    process only has to write strings. Returns (text, count, errors).
+    """
+    lines = []
+    errors = 0
+    for offset, item in enumerate(chunk):
+        result = {"index": start + offset, **render_item(item)}
+        if "error" in result:
+            errors += 1
+        lines.append(json.dumps(result, ensure_ascii=False) + "\n")
+    return "".join(lines), len(lines), errors
+
+def read_items(stream, fmt):
+    """
+    Yields input records one at a time from CSV (with header row) or JSONL.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        line = line.strip()
+        if line:
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"_parse_error": f"Invalid JSON: {e}"}
+                continue
+            yield item if isinstance(item, dict) else {"_parse_error": "Expected a JSON object"}
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_batch(items, out, workers=None, chunk_size=256):
+    """
+    Renders items in a process pool and writes JSONL to `out` as chunks
+    finish, preserving input order. Only a bounded number of chunks is in
+    flight at once, so arbitrarily large inputs stream in constant memory.
+    With a single worker everything is rendered in-process instead.
+    Returns (total, errors).
+    """
+    total = errors = 0
+    workers = workers or os.cpu_count() or 1
+
+    def write(rendered):
+        nonlocal total, errors
+        text, count, chunk_errors = rendered
+        out.write(text)
+        out.flush()
+        total += count
+        errors += chunk_errors
+
+    chunks = chunked(items, chunk_size)
+    if workers == 1:
+        start = 0
+        for chunk in chunks:
+            write(render_chunk(start, chunk))
+            start += len(chunk)
+        return total, errors
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        max_pending = workers * 2
+        start = 0
+        for chunk in chunks:
+            pending.append(pool.submit(render_chunk, start, chunk))
+            start += len(chunk)
+            if len(pending) >= max_pending:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return total, errors
+
+@contextmanager
+def open_input(path):
+    if path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+        try:
+            yield stream
+        finally:
+            stream.detach()  # Leave sys.stdin open for the caller
+        return
+    with open(path, encoding="utf-8-sig", newline="") as stream:
+        yield stream
+
+def detect_format(path, fmt):
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="vinci_bot.py batch",
+        description="Render Facebook listings and counter-offers for many items without prompts."
+    )
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="CSV or JSONL files ('-' for stdin, the default)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file ('-' for stdout)")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"],
+                        help="Input format (default: by file extension, JSONL for stdin)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 renders in-process)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Items per worker task")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    # Check inputs before -o truncates anything, so a typo can't leave half a file
+    if args.inputs.count("-") > 1:
+        parser.error("'-' (stdin) can only be given once")
+    for path in args.inputs:
+        if path != "-" and not (os.path.isfile(path) and os.access(path, os.R_OK)):
+            parser.error(f"cannot read input file: {path}")
+
+    def items():
+        for path in args.inputs:
+            with open_input(path) as stream:
+                yield from read_items(stream, detect_format(path, args.format))
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        total, errors = run_batch(items(), out, workers=args.workers, chunk_size=args.chunk_size)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0
+    # Summary goes to stderr so stdout stays pure JSONL
+    logging.info(f"Batch done: {total} items ({errors} errors) in {elapsed:.2f}s - {rate:,.0f} items/s")
+    return 1 if errors else 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        sys.exit(batch_main(sys.argv[2:]))
     bot = VinciCommerceBot()
     # Loop to keep the menu open
     while True:
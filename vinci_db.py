@@ -0,0 +1,253 @@
+import sqlite3
+import os
+import csv
+import io
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# --- DATABASE SETUP ---
+DB_PATH = "vinci_products.db"
+UPLOAD_DIR = "uploads"
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+_local = threading.local()
+
+def get_db():
+    snapshot = getattr(_local, "snapshot_path", None)
+    if snapshot:
+        # Snapshots are never written to, so skip locking entirely
+        conn = sqlite3.connect(Path(snapshot).resolve().as_uri() + "?immutable=1", uri=True)
+    else:
+        conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+@contextmanager
+def reading_from(snapshot_path):
+    """
+    Routes every get_db() call made by this thread to a read-only snapshot.
+    Other threads (e.g. other Streamlit sessions) keep using the live database.
+    """
+    previous = getattr(_local, "snapshot_path", None)
+    _local.snapshot_path = snapshot_path
+    try:
+        yield
+    finally:
+        _local.snapshot_path = previous
+
+def init_db():
+    conn = get_db()
+    c = conn.cursor()
+    # WAL lets readers (API, exports, backups) run without blocking the app's writes
+    c.execute("PRAGMA journal_mode=WAL")
+    
+    c.execute('''CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        price REAL NOT NULL,
+        currency TEXT DEFAULT 'R ZAR',
+        condition TEXT DEFAULT 'Good',
+        category TEXT DEFAULT 'Other',
+        description TEXT,
+        location TEXT,
+        whatsapp TEXT,
+        images TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        sold INTEGER DEFAULT 0,
+        share_count INTEGER DEFAULT 0,
+        last_shared TIMESTAMP
+    )''')
+    
+    c.execute('''CREATE TABLE IF NOT EXISTS price_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_id INTEGER,
+        old_price REAL,
+        new_price REAL,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (product_id) REFERENCES products(id)
+    )''')
+    
+    c.execute('''CREATE TABLE IF NOT EXISTS templates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        platform TEXT DEFAULT 'Both',
+        template TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )''')
+    
+    conn.commit()
+    conn.close()
+
+# --- DATABASE OPERATIONS ---
+def add_product(name, price, currency, condition, category, description, location, whatsapp, images):
+    conn = get_db()
+    c = conn.cursor()
+    c.execute('''INSERT INTO products (name, price, currency, condition, category, description, location, whatsapp, images)
+                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+              (name, price, currency, condition, category, description, location, whatsapp, images))
+    conn.commit()
+    conn.close()
+
+def _product_filters(category_filter=None, status_filter=None, search_query=None):
+    where = " WHERE 1=1"
+    params = []
+    if category_filter and category_filter != "All":
+        where += " AND category = ?"
+        params.append(category_filter)
+    if status_filter == "Available":
+        where += " AND sold = 0"
+    elif status_filter == "Sold":
+        where += " AND sold = 1"
+    if search_query:
+        where += " AND (name LIKE ? OR description LIKE ?)"
+        params.extend([f"%{search_query}%", f"%{search_query}%"])
+    return where, params
+
+def get_products(category_filter=None, status_filter=None, search_query=None, limit=None, offset=0):
+    conn = get_db()
+    c = conn.cursor()
+    where, params = _product_filters(category_filter, status_filter, search_query)
+    query = "SELECT * FROM products" + where + " ORDER BY created_at DESC, id DESC"
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+    c.execute(query, params)
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+def count_products(category_filter=None, status_filter=None, search_query=None):
+    conn = get_db()
+    c = conn.cursor()
+    where, params = _product_filters(category_filter, status_filter, search_query)
+    c.execute("SELECT COUNT(*) FROM products" + where, params)
+    total = c.fetchone()[0]
+    conn.close()
+    return total
+
+def get_product(product_id):
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("SELECT * FROM products WHERE id = ?", (product_id,))
+    row = c.fetchone()
+    conn.close()
+    return row
+
+def update_product(product_id, **kwargs):
+    conn = get_db()
+    c = conn.cursor()
+    if 'price' in kwargs:
+        old = get_product(product_id)
+        if old and old['price'] != kwargs['price']:
+            c.execute("INSERT INTO price_history (product_id, old_price, new_price) VALUES (?, ?, ?)",
+                     (product_id, old['price'], kwargs['price']))
+    set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
+    values = list(kwargs.values()) + [product_id]
+    c.execute(f"UPDATE products SET {set_clause} WHERE id = ?", values)
+    conn.commit()
+    conn.close()
+
+def delete_product(product_id):
+    conn = get_db()
+    c = conn.cursor()
+    product = get_product(product_id)
+    if product and product['images']:
+        for img in product['images'].split(','):
+            filepath = os.path.join(UPLOAD_DIR, img.strip())
+            if os.path.exists(filepath):
+                os.remove(filepath)
+    c.execute("DELETE FROM products WHERE id = ?", (product_id,))
+    c.execute("DELETE FROM price_history WHERE product_id = ?", (product_id,))
+    conn.commit()
+    conn.close()
+
+def duplicate_product(product_id):
+    product = get_product(product_id)
+    if product:
+        add_product(f"{product['name']} (Copy)", product['price'], product['currency'],
+                   product['condition'], product['category'], product['description'],
+                   product['location'], product['whatsapp'], product['images'])
+
+def get_price_history(product_id):
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("SELECT * FROM price_history WHERE product_id = ? ORDER BY changed_at DESC", (product_id,))
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+def track_share(product_id):
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("UPDATE products SET share_count = share_count + 1, last_shared = ? WHERE id = ?",
+             (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), product_id))
+    conn.commit()
+    conn.close()
+
+# --- TEMPLATES ---
+def get_templates(limit=None, offset=0):
+    conn = get_db()
+    c = conn.cursor()
+    query = "SELECT * FROM templates ORDER BY created_at DESC"
+    params = []
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+    c.execute(query, params)
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+def count_templates():
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM templates")
+    total = c.fetchone()[0]
+    conn.close()
+    return total
+
+def add_template(name, platform, template):
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("INSERT INTO templates (name, platform, template) VALUES (?, ?, ?)", (name, platform, template))
+    conn.commit()
+    conn.close()
+
+def delete_template(template_id):
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("DELETE FROM templates WHERE id = ?", (template_id,))
+    conn.commit()
+    conn.close()
+
+# --- STATS ---
+def get_stats():
+    conn = get_db()
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM products")
+    total = c.fetchone()[0]
+    c.execute("SELECT COUNT(*) FROM products WHERE sold = 0")
+    available = c.fetchone()[0]
+    c.execute("SELECT COUNT(*) FROM products WHERE sold = 1")
+    sold = c.fetchone()[0]
+    c.execute("SELECT SUM(price) FROM products WHERE sold = 0")
+    inventory_value = c.fetchone()[0] or 0
+    c.execute("SELECT SUM(price) FROM products WHERE sold = 1")
+    revenue = c.fetchone()[0] or 0
+    c.execute("SELECT SUM(share_count) FROM products")
+    total_shares = c.fetchone()[0] or 0
+    conn.close()
+    return {"total": total, "available": available, "sold": sold, "inventory_value": inventory_value, "revenue": revenue, "total_shares": total_shares}
+
+# --- EXPORT ---
+EXPORT_COLUMNS = ['Name', 'Price', 'Currency', 'Condition', 'Category', 'Description', 'Location', 'WhatsApp', 'Sold', 'Shares', 'Created']
+
+def products_to_csv(products):
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(EXPORT_COLUMNS)
+    for p in products:
+        writer.writerow([p['name'], p['price'], p['currency'], p['condition'], p['category'], p['description'], p['location'], p['whatsapp'], 'Yes' if p['sold'] else 'No', p['share_count'], p['created_at']])
+    return output.getvalue()